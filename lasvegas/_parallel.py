@@ -0,0 +1,62 @@
+""" Shared logic to spread games over worker processes.
+
+Exported Functions:
+-------------------
+    run_in_chunks: Runs chunks of games of a `Game` in a process pool.
+"""
+
+__all__ = ['run_in_chunks']
+
+from typing import Any, Callable
+import multiprocessing
+
+from tqdm import tqdm
+
+from .game import Game
+
+
+def run_in_chunks(
+        func: Callable[[Game, int, int, bool], Any],
+        game: Game,
+        games: int,
+        processes: int,
+        **tqdm_kwargs: Any) -> list[Any]:
+    """ Runs `games` games of `game` in chunks, over worker processes.
+
+    Every chunk is run by `func(game, num_games, seed, False)`, which
+    must be picklable (_e.g._ a module-level function). Chunk seeds are
+    drawn from `game.env.rng`, so a seeded game replays the same match.
+
+    Arguments:
+    ----------
+        func (Callable): Runs a chunk of games, given the game, the
+            number of games, a seed and whether to show progress.
+        game (Game): Game to run, pickled to every worker.
+        games (int): Total number of games to run. Must be positive.
+        processes (int): Number of worker processes.
+        **tqdm_kwargs (Any): Passed to the chunks progress bar.
+
+    Returns:
+    --------
+        results (list[Any]): Results of `func` for every chunk, in
+            chunks order.
+    """
+    # Different seeds, else forked workers play the same games (both
+    # `random` and the environment's generators are copied)
+    num_chunks = min(games, 4 * processes)
+    seeds = game.env.rng.integers(2 ** 63, size=num_chunks).tolist()
+    chunks = [(func,
+               game,
+               games // num_chunks + (i < games % num_chunks),
+               seed)
+              for i, seed in enumerate(seeds)]
+    with multiprocessing.Pool(processes) as pool:
+        return list(tqdm(pool.imap(_run_chunk, chunks),
+                         total=num_chunks,
+                         **tqdm_kwargs))
+
+
+def _run_chunk(args: tuple) -> Any:
+    """ Unpacks a chunk for `Pool.imap`, without progress. """
+    func, *chunk = args
+    return func(*chunk, False)
@@ -0,0 +1,55 @@
+""" Shared rendering of the package's tables.
+
+Exported Functions:
+-------------------
+    rounded_table: Lightweight equivalent of `tabulate.tabulate`.
+"""
+
+__all__ = ['rounded_table']
+
+from typing import Any, Sequence
+
+
+_JUSTIFY = {
+    'center': lambda cell, width: f"{cell:^{width}}",
+    'left': str.ljust,
+    'right': str.rjust,
+}
+
+
+def rounded_table(
+        lines: Sequence[Sequence[Any]],
+        headers: Sequence[str],
+        colalign: Sequence[str | None],
+        *,
+        rules_after: Sequence[int] = ()) -> str:
+    """ Lightweight equivalent of `tabulate.tabulate` for our tables.
+
+    Renders like `tablefmt="rounded_outline"` with `MIN_PADDING = 0` and
+    whitespace preserved, without the parsing of cells `tabulate` does.
+    Cells must not contain line breaks. A `None` alignment draws its
+    (empty) column as a bare double separator, and `rules_after` lists
+    the indexes of lines followed by an inner rule.
+    """
+    rows = [[str(cell) for cell in row] for row in [headers, *lines]]
+    widths = [max(map(len, column)) for column in zip(*rows)]
+    justify = [align and _JUSTIFY[align] for align in colalign]
+
+    def row_str(row):
+        return '│' + '│'.join(f" {just(cell, width)} " if just else ''
+                              for just, cell, width
+                              in zip(justify, row, widths)) + '│'
+
+    def rule_str(left, mid, right):
+        return left + mid.join('─' * (width + 2) if just else ''
+                               for just, width
+                               in zip(justify, widths)) + right
+
+    inner_rule = rule_str('├', '┼', '┤')
+    table_lines = [rule_str('╭', '┬', '╮'), row_str(rows[0]), inner_rule]
+    for i, row in enumerate(rows[1:]):
+        table_lines.append(row_str(row))
+        if i in rules_after:
+            table_lines.append(inner_rule)
+    table_lines.append(rule_str('╰', '┴', '╯'))
+    return '\n'.join(table_lines)
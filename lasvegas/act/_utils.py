@@ -8,7 +8,6 @@ Exported Functions:
 __all__ = ['prompt_integers']
 
 from typing import Callable
-import itertools
 
 
 def prompt_integers(
@@ -40,10 +39,10 @@ def prompt_integers(
             print(f"Expected {num} inputs (got {len(inputs)})!")
             continue
         # Check if conditions are met
-        for condition, value in itertools.product(conditions, inputs):
-            if not condition(value):
-                print(f"Invalid input: {value}!")
-                break
+        invalid = [value for value in inputs
+                   if not all(condition(value) for condition in conditions)]
+        if invalid:
+            print(f"Invalid input: {invalid[0]}!")
+            continue
         # All good
-        else:
-            return inputs
+        return inputs
@@ -12,7 +12,6 @@ Exported Variables:
 
 __all__ = ['BasePlayer', 'Human', 'Player']
 
-from functools import cached_property
 from typing import Any, TypeVar
 
 from ..core import GameEnv, Play, Roll
@@ -27,18 +26,17 @@ class BasePlayer:
     -----------
         name (str): Name of the player.
         play_func (Policy | None): Playing function or `None`.
+        plays (bool): `play_func is not None` at instanciation.
         roll_func (Rollicy | None): Rolling function or `None`.
-
-    Cached Properties:
-    ------------------
-        plays [get] (bool): `play_func is not None`.
-        rolls [get] (bool): `roll_func is not None`.
+        rolls (bool): `roll_func is not None` at instanciation.
 
     Methods:
     --------
         __call__: Returns a play or a roll given `env`'s state.
         __init__: Constructor for `BasePlayer`.
     """
+    __slots__ = ('name', 'play_func', 'roll_func', 'plays', 'rolls')
+
     def __init__(
             self,
             *,
@@ -57,6 +55,8 @@ class BasePlayer:
         """
         self.roll_func = roll_func
         self.play_func = play_func
+        self.rolls = roll_func is not None
+        self.plays = play_func is not None
         if name is None:
             roll_name = getattr(roll_func, '__name__', 'None')
             play_name = getattr(play_func, '__name__', 'None')
@@ -87,22 +87,14 @@ class BasePlayer:
             AssertionError if behaviour for `action` isn't defined.
         """
         if action == 'play':
-            assert self.plays, "No playing behaviour is defined!"
-            return self.play_func(env, **kwargs)
+            func = self.play_func
         elif action == 'roll':
-            assert self.rolls, "No rolling behaviour is defined!"
-            return self.roll_func(env, **kwargs)
+            func = self.roll_func
         else:
             raise ValueError(f"Parameter `action` should be 'roll' or 'play' "
                              f"(got {action}).")
-
-    @cached_property
-    def plays(self) -> bool:
-        return self.play_func is not None
-
-    @cached_property
-    def rolls(self) -> bool:
-        return self.roll_func is not None
+        assert func is not None, f"No {action}ing behaviour is defined!"
+        return func(env, **kwargs)
 
 
 Player = TypeVar("Player", bound=BasePlayer)
@@ -110,6 +102,8 @@ Player = TypeVar("Player", bound=BasePlayer)
 
 class Human(BasePlayer):
     """ Sub-class of `BasePlayer` destined for CLI use. """
+    __slots__ = ()
+
     def __init__(
             self,
             name: str | None = None,
@@ -21,9 +21,6 @@ __all__ = [
 ]
 
 from typing import Any, Protocol, Sequence
-import random
-
-import numpy as np
 
 from ._utils import prompt_integers
 from ..core import GameEnv, Play
@@ -40,7 +37,8 @@ class Policy(Protocol):
 
 def random_play(env: GameEnv, **__: Any) -> Play:
     """ Chooses a random legal play. """
-    return random.choice(list(env.legal_plays()))
+    plays = env.legal_plays()
+    return plays[int(len(plays) * env.py_rng.random())]
 
 
 def prompt_play(
@@ -55,29 +53,34 @@ def prompt_play(
 
 def greedy_score(env: GameEnv, **__: Any) -> Play:
     """ Greedy for maximum absolute score. """
-    rolled_arr = env.rolled_asarray()
+    plays = env.legal_plays()
+    if len(plays) == 1:  # Forced play
+        return plays[0]
+    # Winners of every casino before and after its play, in two calls
+    all_winners_before = env.get_winners()
+    all_winners_after = env.get_winners(
+        casinos_dice=env.casinos_dice + env.rolled.T)
+    # Read once, used for every play
+    casinos_bills = env.casinos_bills
+    me = env.current_player_index
+
+    def gain(winners, bills):
+        """ Own `(bill, 1)` if winning one of `bills`, else `(0, 0)`. """
+        # Rank from the top, found by C-level list scans
+        if me in winners and (rank := winners[::-1].index(me)) < len(bills):
+            return bills[-1 - rank], 1
+        return 0, 0
+
+    # `(tot, num)` pairs as integers with the same order: `|num| < M/2`
+    M = 2 * len(env.bills_pool) + 1
 
     def net_gain_with_play(play):
         """ Net gain on casino `play` if chosen, for current player. """
-        # Winner before and after `play`
-        winners_before, winners_after = env.get_winners(
-            casinos_dice=[env.casinos_dice[play],
-                          env.casinos_dice[play] + rolled_arr[play]])
-        # Score on casino `play` before playing
-        for winner, bill in zip(winners_before[::-1],
-                                env.casinos_bills[play][::-1]):
-            if winner == env.current_player_index:
-                before, num_before = bill, 1
-                break
-        else:
-            before, num_before = 0, 0
-        # Score on casino `play` after playing
-        for winner, bill in zip(winners_after[::-1],
-                                env.casinos_bills[play][::-1]):
-            if winner == env.current_player_index:
-                return bill - before, 1 - num_before
-        return -before, -num_before
-    return max(env.legal_plays(), key=net_gain_with_play)
+        bills = casinos_bills[play]
+        before, num_before = gain(all_winners_before[play], bills)
+        after, num_after = gain(all_winners_after[play], bills)
+        return (after - before) * M + num_after - num_before
+    return max(plays, key=net_gain_with_play)
 
 
 def greedy_first(env: GameEnv, **__: Any) -> Play:
@@ -86,28 +89,53 @@ def greedy_first(env: GameEnv, **__: Any) -> Play:
     Can choose to finish third instead of second if it means ending
     closer to first.
     """
+    plays = env.legal_plays()
+    if len(plays) == 1:  # Forced play
+        return plays[0]
+    me = env.current_player_index
+    # `[tot, num]` pairs as integers with the same order: `|num| < M/2`.
+    # Sums and differences are preserved, so scores can be added as is.
+    M = 2 * len(env.bills_pool) + 1
     # Current state, before playing
-    winners_before = env.get_winners()
-    casinos_gains_before = [env.get_gains(
-                                [winners_before[casino]],
-                                casinos_bills=[env.casinos_bills[casino]])
-                            for casino in range(env.num_casinos)]
-    round_gains_before = np.sum(casinos_gains_before, axis=0)
-    scores_before = env.scores + round_gains_before
+    casinos_gains_before = _casinos_gains(env, env.get_winners(), M)
+    scores_before = [tot * M + num for tot, num in env.scores.tolist()]
+    for casino_gains in casinos_gains_before:
+        scores_before = [score + gain
+                         for score, gain in zip(scores_before, casino_gains)]
     # After every play was made
-    winners_after = env.get_winners(
-        casinos_dice=env.casinos_dice + env.rolled_asarray())
-    casinos_gains_after = [env.get_gains(
-                               [winners_after[casino]],
-                               casinos_bills=[env.casinos_bills[casino]])
-                           for casino in range(env.num_casinos)]
-
-    def relative_scores_after(play: int) -> tuple[int]:
+    casinos_gains_after = _casinos_gains(env, env.get_winners(
+        casinos_dice=env.casinos_dice + env.rolled.T), M)
+
+    def relative_scores_after(play: int) -> list[int]:
         """ Sorted scores diff (other minus own). Less is better. """
-        scores_after = (scores_before
-                        - casinos_gains_before[play]
-                        + casinos_gains_after[play])
-        scores_after -= scores_after[env.current_player_index]
-        sorted_scores_after = scores_after[env.rank_order(scores=scores_after)]
-        return tuple(sorted_scores_after.ravel())
-    return min(env.legal_plays(), key=relative_scores_after)
+        scores_after = [score - before + after
+                        for score, before, after
+                        in zip(scores_before,
+                               casinos_gains_before[play],
+                               casinos_gains_after[play])]
+        own = scores_after[me]
+        return sorted([score - own for score in scores_after], reverse=True)
+    return min(plays, key=relative_scores_after)
+
+
+def _casinos_gains(
+        env: GameEnv,
+        winners: list[list[int]],
+        M: int) -> list[list[int]]:
+    """ Gains of every collector at every casino, given its winners.
+
+    Equivalent to one `env.get_gains` call per casino, with every
+    `[tot, num]` gain packed as `tot * M + num`. Plain lists: with a
+    handful of casinos and players, NumPy calls would cost more than
+    the arithmetic itself.
+    """
+    num_collectors = env.num_collectors
+    gains = []
+    for casino_winners, casino_bills in zip(winners, env.casinos_bills):
+        casino_gains = [0] * num_collectors
+        for winner, bill in zip(reversed(casino_winners),
+                                reversed(casino_bills)):
+            if winner < num_collectors:
+                casino_gains[winner] = bill * M + 1
+        gains.append(casino_gains)
+    return gains
@@ -13,13 +13,17 @@ Exported Functions:
 __all__ = ['Rollicy', 'prompt_roll', 'random_roll']
 
 from typing import Any, Protocol, Sequence
-import collections
-import random
+
+import numpy as np
 
 from ._utils import prompt_integers
 from ..core import GameEnv, Roll
 
 
+# Number of dice to roll from which NumPy is faster than `random`
+_NUMPY_MIN_DICE = 50
+
+
 class Rollicy(Protocol):
     """ For type hinting. """
     def __call__(
@@ -31,20 +35,29 @@ class Rollicy(Protocol):
 
 def random_roll(env: GameEnv, **__: Any) -> Roll:
     """ Gives a random roll.
-    Since we'll only draw a few random numbers, random.random() is
-    faster than np.random.randint If we wanted to find a lot, we
+    Since we'll only draw a few random numbers, `env.py_rng.random()`
+    is faster than np.random.randint If we wanted to find a lot, we
     would better use NumPy. See:
     https://eli.thegreenplace.net/2018/slow-and-fast-methods-for-generating-random-integers-in-python/
+    From `_NUMPY_MIN_DICE` dice (measured crossover), the counts of all
+    colours are drawn at once from a multinomial distribution, in a
+    single call to `env.rng` whose cost does not depend on the number
+    of dice.
     """
     num_casinos = env.num_casinos
-    roll = []
-    for dice in env.dice_to_roll():
-        sub_roll = dict()
+    dice_to_roll = env.dice_to_roll().tolist()
+    num_dice = sum(dice_to_roll)
+    if num_dice >= _NUMPY_MIN_DICE:
+        return env.rng.multinomial(dice_to_roll,
+                                   np.full(num_casinos, 1 / num_casinos))
+    roll = [0] * (len(dice_to_roll) * num_casinos)
+    py_random = env.py_rng.random
+    offset = 0
+    for dice in dice_to_roll:
         for _ in range(dice):
-            rolled = int(num_casinos * random.random())
-            sub_roll[rolled] = sub_roll.get(rolled, 0) + 1
-        roll.append(sub_roll)
-    return roll
+            roll[offset + int(num_casinos * py_random())] += 1
+        offset += num_casinos
+    return np.fromiter(roll, int, len(roll)).reshape(-1, num_casinos)
 
 
 def prompt_roll(
@@ -54,14 +67,13 @@ def prompt_roll(
         **__) -> Roll:
     """ Shows env state and prompts user to enter a roll in CLI. """
     names = env.colours_name(players_name=players_name)
-    roll = []
-    for to_roll, name in zip(env.dice_to_roll(), names):
+    roll = np.zeros((env.num_colours, env.num_casinos), dtype=int)
+    for sub_roll, to_roll, name in zip(roll, env.dice_to_roll(), names):
         if to_roll == 0:
-            roll.append(dict())
             continue
         sub_roll_list = prompt_integers(f"Roll {to_roll} dice between 0 and "
                                         f"{env.num_casinos-1} for '{name}': ",
                                         to_roll,
                                         lambda d: 0 <= d < env.num_casinos)
-        roll.append(dict(collections.Counter(sub_roll_list)))
+        sub_roll += np.bincount(sub_roll_list, minlength=env.num_casinos)
     return roll
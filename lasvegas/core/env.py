@@ -14,22 +14,21 @@ from __future__ import annotations
 
 __all__ = ['GameEnv', 'Play', 'Roll']
 
-from collections import deque
 from copy import deepcopy
+from functools import lru_cache
 from typing import Any, Sequence
 from warnings import warn
-import itertools
 import random
 
 from numpy.typing import NDArray
 import numpy as np
-import tabulate
 
+from .._table import rounded_table
 from .rules import GameRules
 
 
 Play = int
-Roll = list[dict[int, int]]
+Roll = NDArray[int]  # Shape `(num_colours, num_casinos)`
 
 
 class GameEnv:
@@ -53,6 +52,11 @@ class GameEnv:
         num_xtr_players (int): See `GameRules`.
         order (Sequence[int | None] | bool): Attribute specified at
             instanciation. See `__init__` for details.
+        py_rng (random.Random): Random generator of the instance for
+            scalar draws, seeded from `seed` at instanciation. See
+            `__init__`.
+        rng (np.random.Generator): Random generator of the instance,
+            seeded with `seed` at instanciation. See `__init__`.
         solo_num_distrib (int): See `GameRules`.
         starter (int | bool): Attribute specified at instanciation. See
             `__init__` for details.
@@ -62,15 +66,13 @@ class GameEnv:
 
     Attributes Upon Use:
     --------------------
-        bills (deque): Bills remaining in the "bank".
-        casinos_bills (list[list[int]]): Bills under all casinos, in
-            ascending order.
         current_player_index (int): Explicit.
         current_round (int): Explicit. Is `0` before first round.
         dice (NDArray[int]): Locates every dice of the game. Shape
             `(P + C, P + X)` where `P` is the number of players
             (throwing dice), `X` is the number of "extra" players (not
-            throwing dice) and `C` is the number of casinos.
+            throwing dice) and `C` is the number of casinos. Allocated
+            once and updated in place.
         first_player_index (int): Index of the first player of the
             current round.
         is_over (bool | None): Whether or not the game is over. Is
@@ -80,11 +82,9 @@ class GameEnv:
             either a roll or a play to continue.
         played (Play | None): The moved that was just played if not
             `None`.
-        players_index_cycle (deque): The cycle of next players to come
-            in the current round. Players without dice don't appear
-            after the end of their last turn.
         rolled (Roll | None): The roll that was just made if not `None`.
-        round_order (deque): The order of players in the current round.
+        round_order (list[int]): The order of players in the current
+            round.
         scores (NDArray[int]): Shape `(num_collectors, 2)`. Every line
             is the colour's `[tot_bills, num_bills]` where `tot_bills`
             is the total value of bills won and `num_bills` is the
@@ -92,14 +92,24 @@ class GameEnv:
 
     Properties:
     -----------
+        bills [get] (NDArray[int]): Bills remaining in the "bank", in
+            drawing order.
+        casinos_bills [get] (list[list[int]]): Bills under all casinos,
+            in ascending order. Built once per round from an internal
+            array, must not be modified.
         casinos_dice [get, set] (NDArray[int]): Subarray of `self.dice`,
             of shape `(C, P + X)` with above notations. Row `i`
             corresponds to casino `i`.
         current_dice [get, set] (NDArray[int]): Dice of current player.
+        players_index_cycle [get] (list[int]): The cycle of next players
+            to come in the current round, current player last. Players
+            without dice don't appear after the end of their last turn.
 
     Methods:
     --------
         __call__: Runs the game for potentially multiple steps.
+        __copy__: Independent copy of the game state.
+        __deepcopy__: Like `__copy__`, with copied random generators.
         __init__: Constructor for `GameEnv`.
         colours_name: Outputs list of names associated with all colours.
         dice_to_roll: Number of dice of each colour to roll.
@@ -115,7 +125,7 @@ class GameEnv:
         reset: Sets next step to initialization. Use to restart a game.
         roll: Gives instance a roll.
         roll_is_ok: Sanity check on the roll.
-        rolled_asarray: Formats `self.rolled` as an occurrence array.
+        seed: (Re)seeds `rng` and `py_rng`.
         show: Shows infos, board, roll and scores.
         show_board: Shows dice, bills under casinos and scores.
         show_infos: Shows infos such as round number or next players.
@@ -135,11 +145,10 @@ class GameEnv:
         _initialize_game
         _initialize_round
         _initialize_turn
-        _move_dice
+        _max_casino_bills
         _ordinal
         _reset_roll_and_play
         _solo_special_distribute
-        _update_survival
     """
     def __init__(
             self,
@@ -147,6 +156,7 @@ class GameEnv:
             order: Sequence[int | None] | bool = False,
             starter: int | bool = False,
             rules: GameRules | None = None,
+            seed: int | np.random.SeedSequence | None = None,
             **ruleset: Any) -> None:
         """ Constructor for `GameEnv`.
 
@@ -165,8 +175,15 @@ class GameEnv:
                 still set randomly at game initialization. When passed
                 as `bool`: `True` is equivalent to `range(num_players)`
                 and `False` is equivalent to `()`. Defaults to `False`.
-            rules (GameRules | None): Rules to use if not `None`.
-                Defaults to `None`.
+            rules (GameRules | None): Rules to use if not `None`. Its
+                arrays are copied, so later changes to `rules` don't
+                affect the instance. Defaults to `None`.
+            seed (int | np.random.SeedSequence | None): Seed of `rng`,
+                a `PCG64DXSM` generator used to shuffle bills, and of
+                `py_rng`, used for orders and scalar draws. Each is
+                seeded from its own child of the seed sequence. If
+                `None`, fresh entropy is pulled from the OS. Defaults to
+                `None`.
             starter (int | bool): When passed as `int`, the index of the
                 first player of first round. When passed as `bool`:
                 `True` is equivalent to `order[0]` -- or what the first
@@ -176,10 +193,24 @@ class GameEnv:
             **ruleset (Any): Ignored if `rules is not None`. See
                 `GameRules`.
         """
-        rules = GameRules(**ruleset) if rules is None else deepcopy(rules)
+        rules = GameRules(**ruleset) if rules is None else rules
         self._load_rules(rules)
-        self.order = deepcopy(order)
+        # Buffers, refilled in place at every game or round
+        self.dice = np.empty((self.num_players + self.num_casinos,
+                              self.num_colours),
+                             dtype=self.starting_dice.dtype)
+        # Bills under casino `i` are `_casinos_bills_arr[i, :len_i]`
+        # where `len_i = _casinos_bills_len[i]`, in ascending order.
+        self._casinos_bills_arr = np.zeros(
+            (self.num_casinos, self._max_casino_bills()),
+            dtype=self.bills_pool.dtype)
+        self._casinos_bills_len = np.zeros(self.num_casinos, dtype=int)
+        self._casinos_bills_view = None
+        # Immutable values are shared, other sequences are copied
+        self.order = (order if isinstance(order, (bool, tuple))
+                      else list(order))
         self.starter = starter
+        self.seed(seed)
         self.reset()
 
     ########################
@@ -204,10 +235,77 @@ class GameEnv:
         """ Setter for `casinos_dice` property. """
         self.dice[self.num_players:] = value
 
+    @property
+    def bills(self) -> NDArray[int]:
+        ring_index = np.arange(self._bills_head, self._bills_tail)
+        return self._bills_ring[ring_index % len(self._bills_ring)]
+
+    @property
+    def casinos_bills(self) -> list[list[int]]:
+        if self._casinos_bills_view is None:
+            self._casinos_bills_view = [
+                casino_bills[:num].tolist()
+                for casino_bills, num in zip(self._casinos_bills_arr,
+                                             self._casinos_bills_len.tolist())]
+        return self._casinos_bills_view
+
+    @property
+    def players_index_cycle(self) -> list[int]:
+        order, n = self.round_order, len(self.round_order)
+        cycle = (order[(self._cycle_pos + k) % n] for k in range(1, n + 1))
+        return [i for i in cycle if self._alive_mask >> i & 1]
+
     ########################
     #         API          #
     ########################
 
+    def __copy__(self) -> GameEnv:
+        """ Independent copy of the game state.
+
+        Much cheaper than `copy.deepcopy`: arrays and lists are copied,
+        other attributes are immutable and shared. Random generators
+        are shared too, so that draws made on the copy (_e.g._ by a
+        policy in "safe" mode) still advance them.
+        """
+        new = object.__new__(type(self))
+        new_vars = vars(new)
+        for attr, value in vars(self).items():
+            if isinstance(value, (np.ndarray, list)):
+                value = value.copy()
+            new_vars[attr] = value
+        new._casinos_bills_view = None  # Nested lists, rebuilt lazily
+        if self.next_step is not None:
+            new.next_step = getattr(new, self.next_step.__name__)
+        return new
+
+    def __deepcopy__(self, memo: dict) -> GameEnv:
+        """ Like `__copy__`, with copied random generators.
+
+        About 4x faster than the generic `copy.deepcopy` walk.
+        """
+        new = self.__copy__()
+        new.rng = deepcopy(self.rng, memo)
+        # Cheaper than `deepcopy`, which reseeds from the OS first
+        new.py_rng = random.Random.__new__(random.Random)
+        new.py_rng.setstate(self.py_rng.getstate())
+        return new
+
+    def seed(self, seed: int | np.random.SeedSequence | None = None) -> None:
+        """ (Re)seeds `rng` and `py_rng`. See `__init__` for `seed`. """
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        # One independent child sequence per generator. Same children as
+        # `seed.spawn(2)` on a fresh `seed`, but without mutating it, so
+        # that reusing a `SeedSequence` replays the same games.
+        np_seed, py_seed = (
+            np.random.SeedSequence(seed.entropy,
+                                   spawn_key=(*seed.spawn_key, i),
+                                   pool_size=seed.pool_size)
+            for i in range(2))
+        self.rng = np.random.Generator(np.random.PCG64DXSM(np_seed))
+        self.py_rng = random.Random(
+            int(py_seed.generate_state(1, np.uint64)[0]))
+
     def reset(self) -> None:
         """ Sets next step to initialization. Use to restart a game.
 
@@ -220,6 +318,8 @@ class GameEnv:
     def __call__(self, steps: int | None = None) -> bool:
         """ Runs the game for `steps` steps or for as long as possible.
 
+        Contrary to `one_step`, doesn't warn when there is no next step.
+
         Returns:
         --------
             `True` if the game is over after call, `False` otherwise.
@@ -230,7 +330,8 @@ class GameEnv:
                 - `steps is None or steps >= 0`.
         """
         assert steps is None or steps >= 0
-        while steps != 0 and self.one_step():
+        while steps != 0 and self.next_step is not None:
+            self.next_step()
             steps = steps and steps - 1
         return self.is_over
 
@@ -252,21 +353,26 @@ class GameEnv:
         """ Gives instance a roll.
 
         Warning: No sanity check for dice availability, sign, type...!
+        The roll is stored as is, so it must already be an array.
 
         Arguments:
         ----------
-            rolled (Roll): List, for each colour, or occurence dict of
-                rolled dice.
+            rolled (Roll): Array of shape `(num_colours, num_casinos)`
+                where `rolled[i, d]` is the number of dice of colour `i`
+                showing value `d`.
             """
         self.rolled = rolled
+        self._legal_cache = None  # Computed on demand by `legal_plays`
         self.next_step = None
 
     def play(self, played: Play) -> None:
         """ Gives instance a playing move.
 
-        The playing move must be legal here.
+        The playing move must be legal here. This is only checked in
+        debug mode, _i.e._ not when Python runs with `-O`.
         """
-        assert played in self.legal_plays()
+        assert (self.rolled is not None
+                and played in self.legal_plays()), f"Illegal play: {played}"
         self.played = played
         self.next_step = self._end_turn
 
@@ -288,10 +394,14 @@ class GameEnv:
     def _initialize_game(self) -> None:
         self.is_over = False
         # Shuffle bills. Rules say only once at start? Unclear...
-        self.bills = deque(self.bills_pool)
-        random.shuffle(self.bills)
+        # The bank is a ring buffer: bills are drawn at `_bills_head` and
+        # given back at `_bills_tail`.
+        self._bills_ring = self.bills_pool.copy()
+        self.rng.shuffle(self._bills_ring)
+        self._bills_head, self._bills_tail = 0, len(self._bills_ring)
         # Scores
-        self.casinos_bills = [[] for _ in range(self.num_casinos)]
+        self._casinos_bills_len[:] = 0
+        self._casinos_bills_view = None
         self.scores = np.full((self.num_collectors, 2), 0)
         # Game state init
         self.current_round = 0
@@ -317,17 +427,18 @@ class GameEnv:
             specified_order = self.order[:n]
         order = []
         lacking_indexes = list(set(R) - set(specified_order))
-        random.shuffle(lacking_indexes)
+        self.py_rng.shuffle(lacking_indexes)
         for v in specified_order:  # Assumed `None` or in `R`.
             order.append(lacking_indexes.pop() if v is None else v)
         order.extend(lacking_indexes)
-        self.round_order = deque(order)
         # Starter
         if isinstance(self.starter, bool):
-            starter = order[0] if self.starter else random.choice(R)
+            starter = order[0] if self.starter else self.py_rng.choice(R)
         else:
             starter = self.starter
-        self.round_order.rotate(- self.round_order.index(starter) + 1)
+        # Rotated so that `starter` comes first after next rotation
+        k = order.index(starter) - 1
+        self.round_order = order[k:] + order[:k]
         # Sanity checks
         assert len(order) == n and set(order) == set(R)
 
@@ -343,9 +454,11 @@ class GameEnv:
         self.current_round += 1
         self._initialize_dice()
         self._draw_bills()
-        self.round_order.rotate(-1)
-        self.players_index_cycle = deque(self.round_order)
+        self.round_order = self.round_order[1:] + self.round_order[:1]
         self.first_player_index = self.round_order[0]
+        # Players still having dice, and position of current player
+        self._alive_mask = (1 << self.num_players) - 1
+        self._cycle_pos = self.num_players - 1
         self.next_step = self._initialize_turn
 
     def _initialize_dice(self) -> None:
@@ -353,18 +466,21 @@ class GameEnv:
 
         Special case of 1-player game handled.
         """
-        casinos_dice = np.full((self.num_casinos, self.num_colours), 0)
-        self.dice = np.r_[self.starting_dice, casinos_dice]
+        self.dice[:self.num_players] = self.starting_dice
+        self.dice[self.num_players:] = 0
         if self.num_players == 1:
             self._solo_special_distribute()
 
     def _solo_special_distribute(self) -> None:
         """ In 1-player game, rounds start by special distribution. """
-        for xtr_idx in random.sample(range(1, self.num_xtr_players + 1),
-                                     self.solo_num_distrib):
-            for _ in range(self.dice[0, xtr_idx]):
-                dice = int(self.num_casinos * random.random())
-                self.casinos_dice[dice, xtr_idx] += 1
+        num_casinos, py_random = self.num_casinos, self.py_rng.random
+        for xtr_idx in self.py_rng.sample(
+                range(1, self.num_xtr_players + 1), self.solo_num_distrib):
+            # Counted per casino first, then added to the board at once
+            counts = [0] * num_casinos
+            for _ in range(int(self.dice[0, xtr_idx])):
+                counts[int(num_casinos * py_random())] += 1
+            self.dice[self.num_players:, xtr_idx] += counts
             self.dice[0, xtr_idx] = 0
 
     def _draw_bills(self) -> None:
@@ -372,30 +488,47 @@ class GameEnv:
 
         Under each casino, bills are sorted in ascending order.
         """
-        for i in range(self.num_casinos):
+        ring, size = self._bills_ring, len(self._bills_ring)
+        head, tail = self._bills_head, self._bills_tail
+        for i, casino_min in enumerate(self.casinos_min.tolist()):
+            drawn = []
             total = 0
-            while total < self.casinos_min[i] and self.bills:
-                bill = self.bills.popleft()
-                self.casinos_bills[i].append(bill)
+            while total < casino_min and head < tail:
+                bill = int(ring[head % size])
+                head += 1
+                drawn.append(bill)
                 total += bill
-            self.casinos_bills[i].sort()
+            drawn.sort()
+            self._casinos_bills_arr[i, :len(drawn)] = drawn
+            self._casinos_bills_len[i] = len(drawn)
+        self._bills_head = head
+        self._casinos_bills_view = None
 
     def _give_bills(self) -> None:
         """ Gives won bills to players at the end of a round.
 
         Hypothesis: Casinos bills are sorted in ascending order.
         """
+        ring, size = self._bills_ring, len(self._bills_ring)
+        tail = self._bills_tail
+        num_collectors = self.num_collectors
+        gains = [0] * (2 * num_collectors)  # Flat `[tot, num]` pairs
         # Looping over casinos
         for casino_bills, winners in zip(self.casinos_bills,
                                          self.get_winners()):
-            # While there are still bills under this casino
-            while casino_bills:
-                bill = casino_bills.pop()
+            # From the highest bill under this casino
+            for bill in reversed(casino_bills):
                 # If there are still collecting winners
-                if winners and (winner := winners.pop()) < self.num_collectors:
-                    self.scores[winner] += [bill, 1]
+                if winners and (winner := winners.pop()) < num_collectors:
+                    gains[2 * winner] += bill
+                    gains[2 * winner + 1] += 1
                 else:
-                    self.bills.append(bill)
+                    ring[tail % size] = bill
+                    tail += 1
+        self._bills_tail = tail
+        self.scores += np.reshape(gains, (-1, 2))
+        self._casinos_bills_len[:] = 0
+        self._casinos_bills_view = None
 
     def _end_round(self) -> None:
         self._give_bills()
@@ -410,36 +543,41 @@ class GameEnv:
 
     def _initialize_turn(self) -> None:
         self._reset_roll_and_play()
-        self.current_player_index = self.players_index_cycle.popleft()
-        self.players_index_cycle.append(self.current_player_index)
+        # Next player still having dice
+        order, n = self.round_order, self.num_players
+        pos = self._cycle_pos
+        while True:
+            pos = (pos + 1) % n
+            if self._alive_mask >> order[pos] & 1:
+                break
+        self._cycle_pos = pos
+        self.current_player_index = order[pos]
         self.next_step = None
 
     def _reset_roll_and_play(self) -> None:
+        # Roll-derived caches are only valid while `self.rolled` is set,
+        # and are all overwritten by `roll`.
         self.played = self.rolled = None
 
     def _end_turn(self) -> None:
-        self._move_dice()
-        self._update_survival()
-        self.next_step = (
-            self._initialize_turn
-            if self.players_index_cycle
-            else self._end_round)
+        """ Closes the turn and directly opens the next one, if any.
 
-    def _move_dice(self) -> None:
-        """ Moves dice from player to casino after roll and play.
+        Moves dice from player to casino, removes current player if they
+        don't have any dice left, then either initializes next turn or
+        sets next step to end of round.
 
         Hypothesis: `self.rolled` and `self.played` are properly set.
         """
-        to_move = np.array([
-            sub_roll.get(self.played, 0)
-            for sub_roll in self.rolled])
-        self.current_dice -= to_move
-        self.casinos_dice[self.played] += to_move
-
-    def _update_survival(self) -> None:
-        """ Removes current player that doesn't have any dice left. """
-        if not self.current_dice.any():
-            self.players_index_cycle.pop()
+        to_move = self.rolled[:, self.played]
+        player_dice = self.dice[self.current_player_index]
+        player_dice -= to_move
+        self.dice[self.num_players + self.played] += to_move
+        if not player_dice.any():
+            self._alive_mask &= ~(1 << self.current_player_index)
+        if self._alive_mask:
+            self._initialize_turn()
+        else:
+            self.next_step = self._end_round
 
     ########################
     #        UTILS         #
@@ -463,6 +601,23 @@ class GameEnv:
             'xtr_collect')
         for attr in attributes:
             setattr(self, attr, getattr(rules, attr))
+        # Only arrays can be altered through `rules`, copy them alone
+        self.bills_pool = self.bills_pool.copy()
+        self.casinos_min = self.casinos_min.copy()
+        self.starting_dice = self.starting_dice.copy()
+        # Weights packing a casino row in one integer, see `get_winners`
+        self._swar_lanes = (256 ** np.arange(self.num_colours)
+                            if self.num_colours <= 7 and self.max_dice < 256
+                            else None)
+
+    def _max_casino_bills(self) -> int:
+        """ Maximum number of bills that can be drawn under a casino. """
+        pool_size = len(self.bills_pool)
+        min_bill = self.bills_pool.min() if pool_size else 0
+        if min_bill <= 0:
+            return pool_size
+        # Drawing stops as soon as the minimum is reached
+        return min(pool_size, -(-self.casinos_min.max(initial=0) // min_bill))
 
     def dice_to_roll(self,
                      *,
@@ -486,42 +641,29 @@ class GameEnv:
         """ Sanity check on the roll.
 
         It checks the following three things:
-            - The values rolled are authorized values,
+            - The roll is an integer `np.ndarray` of shape
+              `(num_colours, num_casinos)`,
             - For each value, the number of dice is positive,
-            - The total number of dice rolled is coorect.
+            - The total number of dice rolled is correct.
         """
-        authorized = set(range(self.num_casinos))
-        for num, sub_roll in zip(self.dice_to_roll(), rolled, strict=True):
-            dice_val = set(sub_roll)
-            dice_pos = [n >= 0 for d, n in sub_roll.items() if d in authorized]
-            num_dice = sum(n for d, n in sub_roll.items() if d in authorized)
-            if (dice_val <= authorized
-                    and all(dice_pos)
-                    and num_dice == num):
-                continue
-            break
-        else:
-            return True
-        return False
-
-    def rolled_asarray(self) -> NDArray[int]:
-        """ Formats `self.rolled` as an occurrence array.
-
-        Output has shape `(self.num_casinos, self.num_colours)`.
-        """
-        res = np.full(self.casinos_dice.shape, 0)
-        for i, sub_roll in enumerate(self.rolled):
-            for dice, qty in sub_roll.items():
-                res[dice, i] = qty
-        return res
+        return bool(isinstance(rolled, np.ndarray)
+                    and rolled.shape == (self.num_colours, self.num_casinos)
+                    and np.issubdtype(rolled.dtype, np.integer)
+                    and np.all(rolled >= 0)
+                    and np.all(rolled.sum(axis=1) == self.dice_to_roll()))
 
-    def legal_plays(self) -> set[int]:
-        """ Returns legal plays given `self.rolled`.
+    def legal_plays(self) -> tuple[int, ...]:
+        """ Returns legal plays given `self.rolled`, in ascending order.
 
-        Careful, no sanitation of the roll.
+        Computed on the first call after a roll, later calls return the
+        same instance. Careful, no sanitation of the roll.
         """
         assert self.rolled is not None, "No dice were rolled!"
-        return set.union(*map(set, self.rolled))
+        if self._legal_cache is None:
+            # Casinos of the non-zero counts, any colour
+            self._legal_cache = tuple(
+                sorted(set(self.rolled.nonzero()[1].tolist())))
+        return self._legal_cache
 
     def get_winners(
             self,
@@ -536,29 +678,45 @@ class GameEnv:
         Example: If number of dice on a casino are [1, 2, 4, 2, 0, 3],
         winners are [0, 5, 2]
 
-        Implementation specific to the game, for low `self.max_dice`.
-        For higher values, simpler implementation might be faster. To
-        test eventually.
+        When rules allow it, every casino row is packed in a single
+        integer (one byte per colour) and winners are memoized by
+        packed value. Otherwise, with many colours, all casinos are
+        processed at once by sorting rows and looking for values
+        different from both neighbours. With fewer colours, rows are
+        converted to lists once: NumPy calls overhead then costs more
+        than `list.count` on a handful of colours.
 
         Arguments:
         ----------
             casinos_dice (NDArray[int]): If not `None`, value to use
-                instead of `self.casinos_dice`. Defaults to `None`. The
-                *Warning*: if `max(cainos_dice) > self.max_dice`, which
-                doesn't happen in normal use cases, an `IndexError` will
-                occur.
+                instead of `self.casinos_dice`. Defaults to `None`.
+                *Warning*: values above `self.max_dice`, which don't
+                happen in normal use cases, are not supported.
         """
         if casinos_dice is None:
             casinos_dice = self.casinos_dice
+        if self._swar_lanes is not None:
+            packed = (np.asarray(casinos_dice) @ self._swar_lanes).tolist()
+            return [list(_packed_winners(casino_packed, self.num_colours))
+                    for casino_packed in packed]
+        if self.num_colours > 16:
+            casinos_dice = np.asarray(casinos_dice)
+            order = np.argsort(casinos_dice, axis=1, kind='stable')
+            values = np.take_along_axis(casinos_dice, order, axis=1)
+            differs = np.diff(values, axis=1) != 0
+            edge = np.ones((len(values), 1), dtype=bool)
+            is_unique = (np.hstack([edge, differs])
+                         & np.hstack([differs, edge])
+                         & (values > 0))
+            unique_order = np.where(is_unique, order, -1).tolist()
+            return [[i for i in casino_order if i >= 0]
+                    for casino_order in unique_order]
         winners = []
-        for casino_dice in casinos_dice:
-            uniques = []
-            occ = [2] + [0] * self.max_dice
-            for val in casino_dice:
-                occ[val] += 1
-            for i, val in enumerate(casino_dice):
-                if occ[val] == 1:
-                    uniques.append(i)
+        for casino_dice in np.asarray(casinos_dice).tolist():
+            uniques = [i for i, val in enumerate(casino_dice)
+                       if val and casino_dice.count(val) == 1]
+            # Bound C method as key: no Python frame per element, and
+            # faster than sorting `(value, index)` tuples here.
             winners.append(sorted(uniques, key=casino_dice.__getitem__))
         return winners
 
@@ -593,31 +751,35 @@ class GameEnv:
         """
         if casinos_bills is None:
             casinos_bills = self.casinos_bills
+        # Summed as Python ints, converted to an array once at the end
         if isinstance(who_unique, int):
-            gains = np.full(2, 0)
+            tot = num = 0
             for casino_winners, casino_bills in zip(winners,
                                                     casinos_bills,
                                                     strict=True):
-                for winner, bill in zip(casino_winners[::-1],
-                                        casino_bills[::-1]):
+                for winner, bill in zip(reversed(casino_winners),
+                                        reversed(casino_bills)):
                     if winner == who_unique:
-                        gains += [bill, 1]
-                        continue
-        else:
-            if who_unique is None:
-                who_unique = range(self.num_collectors)
-            who_map = {w: i for i, w in enumerate(who_unique)}
-            gains = np.full((len(who_unique), 2), 0)
-            for casino_winners, casino_bills in zip(winners,
-                                                    casinos_bills,
-                                                    strict=True):
-                for winner, bill in zip(casino_winners[::-1],
-                                        casino_bills[::-1]):
-                    if (idx := who_map.get(winner, None)) is not None:
-                        gains[idx] += [bill, 1]
-        return gains
+                        tot += int(bill)
+                        num += 1
+                        break
+            return np.array([tot, num])
+        if who_unique is None:
+            who_unique = range(self.num_collectors)
+        who_map = {w: i for i, w in enumerate(who_unique)}
+        gains = [[0, 0] for _ in range(len(who_unique))]
+        for casino_winners, casino_bills in zip(winners,
+                                                casinos_bills,
+                                                strict=True):
+            for winner, bill in zip(reversed(casino_winners),
+                                    reversed(casino_bills)):
+                if (idx := who_map.get(winner)) is not None:
+                    gains[idx][0] += int(bill)
+                    gains[idx][1] += 1
+        return np.array(gains, dtype=int).reshape(-1, 2)
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def _ordinal(n: int) -> str:
         """ 12 -> '12th', 23 -> '23rd' etc... """
         if 11 <= n % 100 <= 13:
@@ -640,7 +802,8 @@ class GameEnv:
         """
         if scores is None:
             scores = self.scores
-        order = np.flip(np.lexsort(np.rot90(scores)))
+        # Total value first, then number of bills, decreasing
+        order = np.lexsort((scores[:, 1], scores[:, 0]))[::-1]
         return order
 
     def rankings(self, *, scores: NDArray[int] | None = None) -> NDArray[int]:
@@ -654,10 +817,8 @@ class GameEnv:
         if scores is None:
             scores = self.scores
         order = self.rank_order(scores=scores)
-        ranks = np.argsort(order)
-        for i, ii in itertools.pairwise(order):
-            if all(scores[ii] == scores[i]):
-                ranks[ii] = ranks[i]
+        ranks = np.empty_like(order)
+        ranks[order] = _ordered_ranks(scores[order])
         return ranks
 
     def colours_name(
@@ -774,28 +935,12 @@ class GameEnv:
             dice = dice.astype(str)
             np.place(dice, dice == '0', [''])
             line.extend(dice if X == 0 else np.insert(dice, P, ''))
-        # Tabulate
-        colalign = ('right', 'left') + ('center',) * (len(headers) - 2)
-        tablefmt = "rounded_outline"
-        MIN_PADDING_bak = tabulate.MIN_PADDING
-        tabulate.MIN_PADDING = 0
-        table = tabulate.tabulate(lines,
-                                  headers=headers,
-                                  colalign=colalign,
-                                  tablefmt=tablefmt)
-        tabulate.MIN_PADDING = MIN_PADDING_bak
-        # Thiner empty column by hand
-        table_lines = table.split('\n')
+        # Tabulate, with a thin empty column before extra players and a
+        # rule between players and casinos
+        colalign = ['right', 'left'] + ['center'] * (len(headers) - 2)
         if X > 0:
-            line_x = table_lines[1]
-            sep = tabulate._table_formats[tablefmt].datarow.sep
-            assert sep.strip() != '', "Choose a `tablefmt` with column sep."
-            ir = line_x.rfind(sep, 0, line_x.find(xtr_symb))
-            il = line_x.rfind(sep, 0, ir)
-            table_lines = [line[:il+1] + line[ir:] for line in table_lines]
-        # Horizontal Sep by hand (cuz bugged)
-        table_lines = table_lines[:P+3] + [table_lines[2]] + table_lines[P+3:]
-        table = '\n'.join(table_lines)
+            colalign[P + 2] = None
+        table = rounded_table(lines, headers, colalign, rules_after=(P - 1,))
         print("\nBoard State:")
         print(table)
 
@@ -833,48 +978,36 @@ class GameEnv:
         names = self.colours_name(players_name=players_name)
         # Roll strings
         D = range(self.num_casinos)
-        max_d = np.array([max(sub_roll.get(dice, 0)
-                              for sub_roll in self.rolled)
-                          for dice in D])
+        max_d = self.rolled.max(axis=0).tolist()
+        has_rolled = self.rolled.any(axis=1).tolist()
 
         def dice_str(sub_roll, dice):  # E.g. `'4  '`.
             d = str(dice)
-            k = sub_roll.get(dice, 0)
+            k = sub_roll[dice]
             return ' '.join([d] * k + [' ' * len(d)] * (max_d[dice] - k))
-        all_sub_roll_str = np.array([' │ '.join(dice_str(sub_roll, dice)
-                                                for dice in D if max_d[dice])
-                                     for sub_roll in self.rolled])
+        all_sub_roll_str = [' │ '.join(dice_str(sub_roll, dice)
+                                       for dice in D if max_d[dice])
+                            for sub_roll in self.rolled.tolist()]
         # Tabulate
         lines = []
         for i in order:
-            sub_roll_str = all_sub_roll_str[i]
-            if sub_roll_str.strip(' │'):
+            if has_rolled[i]:
                 name = names[i]
                 if i == self.first_player_index:
                     name += ' (*)'
                 if i == self.current_player_index:
                     name = f"► {name} ◄"
                 tot, num = self.scores[i]
-                line = [f"{tot} ({num})", name, sub_roll_str]
+                line = [f"{tot} ({num})", name, all_sub_roll_str[i]]
                 lines.append(line)
         for i in range(self.num_collectors, self.num_colours):
-            sub_roll_str = all_sub_roll_str[i]
-            if sub_roll_str.strip(' │'):
+            if has_rolled[i]:
                 name = names[i]
-                line = ["- (-)", name, sub_roll_str]
+                line = ["- (-)", name, all_sub_roll_str[i]]
                 lines.append(line)
         headers = ('Scores', 'Players', 'Dice')
         colalign = ('right', 'left', 'center')
-        PRESERVE_WHITESPACE_bak = tabulate.PRESERVE_WHITESPACE
-        MIN_PADDING_bak = tabulate.MIN_PADDING
-        tabulate.PRESERVE_WHITESPACE = True
-        tabulate.MIN_PADDING = 0
-        table = tabulate.tabulate(lines,
-                                  headers=headers,
-                                  colalign=colalign,
-                                  tablefmt="rounded_outline")
-        tabulate.PRESERVE_WHITESPACE = PRESERVE_WHITESPACE_bak
-        tabulate.MIN_PADDING = MIN_PADDING_bak
+        table = rounded_table(lines, headers, colalign)
         # TODO
         print("\nJust Rolled:")
         print(table)
@@ -917,10 +1050,7 @@ class GameEnv:
         # Rankings
         order = self.rank_order()
         ordered_scores = self.scores[order]
-        ranks = np.arange(self.num_collectors)
-        for i, (s, ss) in enumerate(itertools.pairwise(ordered_scores)):
-            if np.all(s == ss):
-                ranks[i+1] = ranks[i]
+        ranks = _ordered_ranks(ordered_scores)
         # Headers and align
         headers = ('Scores', 'Players', '#')
         colalign = ('right', 'left', 'center')
@@ -934,13 +1064,27 @@ class GameEnv:
                 name = f"► {name} ◄"
             line = [f"{tot} ({num})", name, self._ordinal(rank + 1)]
             lines.append(line)
-        MIN_PADDING_bak = tabulate.MIN_PADDING
-        tabulate.MIN_PADDING = 0
-        table = tabulate.tabulate(lines,
-                                  headers=headers,
-                                  colalign=colalign,
-                                  tablefmt="rounded_outline")
-        tabulate.MIN_PADDING = MIN_PADDING_bak
+        table = rounded_table(lines, headers, colalign)
         # Show
         print("\nLive Rankings:")
         print(table)
+
+
+@lru_cache(maxsize=1 << 16)
+def _packed_winners(packed: int, num_colours: int) -> tuple[int, ...]:
+    """ Winners of one casino, from its row packed by `get_winners`. """
+    casino_dice = [(packed >> (8 * i)) & 0xFF for i in range(num_colours)]
+    uniques = [i for i, val in enumerate(casino_dice)
+               if val and casino_dice.count(val) == 1]
+    return tuple(sorted(uniques, key=casino_dice.__getitem__))
+
+
+def _ordered_ranks(ordered_scores: NDArray[int]) -> NDArray[int]:
+    """ Ranks of scores sorted from best to worst, equals sharing one.
+
+    Every group of equal scores gets the position of its first element.
+    """
+    starts = np.ones(len(ordered_scores), dtype=bool)
+    starts[1:] = (ordered_scores[1:] != ordered_scores[:-1]).any(axis=1)
+    positions = np.where(starts, np.arange(len(ordered_scores)), 0)
+    return np.maximum.accumulate(positions)
@@ -41,6 +41,12 @@ class RuleBook:
     solo_num_distrib: int = 1
 
 
+# Rulebook bills listed with repetitions, expanded once
+_RULEBOOK_BILLS_POOL = np.repeat(
+    np.array(list(RuleBook.bills_pool), dtype=int),
+    list(RuleBook.bills_pool.values()))
+
+
 class GameRules:
     """ Class to set (eventually custom) rules.
 
@@ -161,11 +167,12 @@ class GameRules:
         if starting_dice is not None:
             self.starting_dice = np.array(starting_dice, dtype=int)
         else:
-            if num_players in RuleBook.xtr_rules:
+            xtr_rule = RuleBook.xtr_rules.get(num_players)
+            if xtr_rule is not None:
                 if num_xtr_players is None:
-                    num_xtr_players = RuleBook.xtr_rules[num_players][0]
+                    num_xtr_players = xtr_rule[0]
                 if num_xtr_dice is None:
-                    num_xtr_dice = RuleBook.xtr_rules[num_players][1]
+                    num_xtr_dice = xtr_rule[1]
             elif num_players is None:
                 raise ValueError("Rules lack `num_players` specification!")
             elif None in (num_xtr_players, num_xtr_dice):
@@ -177,18 +184,21 @@ class GameRules:
                         f"`num_xtr_players` and `num_xtr_dice`!")
             if num_own_dice is None:
                 num_own_dice = RuleBook.num_own_dice
-            own = num_own_dice * np.eye(num_players, dtype=int)
-            xtr = np.full((num_players, num_xtr_players), num_xtr_dice)
-            self.starting_dice = np.c_[own, xtr]
+            # Own dice on the diagonal, extra dice in the last columns
+            self.starting_dice = np.zeros(
+                (num_players, num_players + num_xtr_players), dtype=int)
+            np.fill_diagonal(self.starting_dice, num_own_dice)
+            self.starting_dice[:, num_players:] = num_xtr_dice
         # Xtr collect
-        num_players = len(self.starting_dice)
-        num_xtr_players = len(self.starting_dice.T) - num_players
+        num_players, num_colours = self.starting_dice.shape
+        num_xtr_players = num_colours - num_players
+        xtr_rule = RuleBook.xtr_rules.get(num_players)
         if num_xtr_players == 0:
             self.xtr_collect = False
         elif xtr_collect is not None:
             self.xtr_collect = xtr_collect
-        elif num_players in RuleBook.xtr_rules:
-            self.xtr_collect = RuleBook.xtr_rules[num_players][2]
+        elif xtr_rule is not None:
+            self.xtr_collect = xtr_rule[2]
         else:
             raise ValueError(
                 f"With {num_players} players, rules lack `xtr_collect` "
@@ -215,14 +225,12 @@ class GameRules:
             self.casinos_min = np.full(num_casinos, casinos_min)
         # Bills
         if bills_pool is None:
-            bills_pool = RuleBook.bills_pool
-        self.bills_pool = np.array(
-            [bill
-             for val, qty in bills_pool.items()
-             for bill in [val] * qty]
-            if isinstance(bills_pool, dict)
-            else bills_pool,
-            dtype=int)
+            self.bills_pool = _RULEBOOK_BILLS_POOL.copy()
+        elif isinstance(bills_pool, dict):
+            self.bills_pool = np.repeat(np.array(list(bills_pool), dtype=int),
+                                        list(bills_pool.values()))
+        else:
+            self.bills_pool = np.array(bills_pool, dtype=int)
         # Sanity check
         self._sanity_check()
 
@@ -232,24 +240,30 @@ class GameRules:
         return f"{cls_name}({attr_str})"
 
     def _sanity_check(self) -> None:
-        """ Raises AssertionError if sanity checks on attributes fail. """
+        """ Raises AssertionError if sanity checks on attributes fail.
+
+        Array methods are used rather than `np.all` functions, which
+        cost about twice as much on such small arrays. Like every
+        assertion, the checks are skipped when Python runs with `-O`.
+        """
         # Bills
         assert self.bills_pool.dtype == int
-        assert np.all(self.bills_pool > 0)
+        assert (self.bills_pool > 0).all()
         # Casinos_min
         assert self.casinos_min.dtype == int
-        assert np.all(self.casinos_min >= 0)
+        assert (self.casinos_min >= 0).all()
         # Dice_matrix
         assert self.starting_dice.dtype == int
-        assert 0 < len(self.starting_dice) <= len(self.starting_dice.T)
-        assert np.all(self.casinos_min >= 0)
+        assert self.starting_dice.ndim == 2
+        num_players, num_colours = self.starting_dice.shape
+        assert 0 < num_players <= num_colours
+        assert (self.starting_dice >= 0).all()
         assert self.starting_dice.any(axis=0).all()
         # Num_rounds
         assert isinstance(self.num_rounds, int) and self.num_rounds > 0
         # Solo number of dice set distributed
         assert isinstance(self.solo_num_distrib, int)
-        num_xtr_players = len(self.starting_dice.T) - len(self.starting_dice)
-        assert 0 <= self.solo_num_distrib <= num_xtr_players
+        assert 0 <= self.solo_num_distrib <= num_colours - num_players
         # Xtr_collect
         assert isinstance(self.xtr_collect, bool)
 
@@ -263,11 +277,11 @@ class GameRules:
 
     @property
     def num_players(self) -> int:
-        return len(self.starting_dice)
+        return self.starting_dice.shape[0]
 
     @property
     def num_colours(self) -> int:
-        return len(self.starting_dice.T)
+        return self.starting_dice.shape[1]
 
     @property
     def num_xtr_players(self) -> int:
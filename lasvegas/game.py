@@ -8,8 +8,7 @@ Exported Classes:
 
 __all__ = ['Game']
 
-from copy import deepcopy
-from functools import cached_property
+from copy import copy
 from typing import Any
 import traceback
 
@@ -35,13 +34,12 @@ class Game:
             `num_players`.
         players (list[Player]): List of players of the game. Start of
             the list contains players passed at instanciation.
+        players_name (tuple[str, ...]): Names of `players`, computed
+            once at instanciation.
         safe (bool): When `True`, players are only passed a copy of
-            the environment and players name. Slows down game execution.
-            Additional roll and play sanity checks are also made.
-
-    Cached Properties:
-    ------------------
-        players_name [get] (list[str]): Explicit.
+            the environment (see `GameEnv.__copy__`) and players name.
+            Slows down game execution. Additional roll and play sanity
+            checks are also made.
 
     Methods:
     --------
@@ -52,8 +50,8 @@ class Game:
     -----------------
         _add_missing_players
     """
-    default_policy = random_play
-    default_rollicy = random_roll
+    default_policy = staticmethod(random_play)
+    default_rollicy = staticmethod(random_roll)
 
     def __init__(
             self,
@@ -84,6 +82,7 @@ class Game:
         self.num_given_players = min(len(players), self.env.num_players)
         self.players = players[:self.num_given_players]
         self._add_missing_players()
+        self.players_name = tuple(player.name for player in self.players)
         self.safe = safe
 
     def _add_missing_players(self) -> None:
@@ -91,58 +90,53 @@ class Game:
         added_bots = [BasePlayer(name=f"Bot {i}") for i in range(num_to_add)]
         self.players.extend(added_bots)
 
-    @cached_property
-    def players_name(self) -> list[str]:
-        return [player.name for player in self.players]
-
     def run(self) -> None:
         """ Plays a game from start to finish. """
-        self.env.reset()
+        # Locals for the turn loop
+        env = self.env
+        players_name = self.players_name
+        safe = self.safe
+        env.reset()
         play_pol_roll = [(
                 player,
                 player.play_func if player.plays else Game.default_policy,
                 player.roll_func if player.rolls else Game.default_rollicy)
             for player in self.players]
-        while not self.env():
-            cp, policy, rollicy = play_pol_roll[self.env.current_player_index]
+        while not env():
+            cp, policy, rollicy = play_pol_roll[env.current_player_index]
             # Secure Mode
-            if self.safe:
+            if safe:
                 # Roll
-                if self.env.rolled is None:
+                if env.rolled is None:
                     try:
-                        rolled = rollicy(
-                                      deepcopy(self.env),
-                                      players_name=deepcopy(self.players_name))
-                        assert self.env.roll_is_ok(rolled)
-                        self.env.roll(rolled)
+                        rolled = rollicy(copy(env), players_name=players_name)
+                        assert env.roll_is_ok(rolled)
+                        env.roll(rolled)
                     except Exception as e:
                         _pretty_catch(e, f"Caught the following exception "
                                          f"while player '{cp.name}' rolled:")
-                        self.env.roll(self.default_rollicy(self.env))
+                        env.roll(self.default_rollicy(env))
                 # Play
                 try:
-                    played = policy(deepcopy(self.env),
-                                    players_name=deepcopy(self.players_name))
-                    if played not in self.env.legal_plays():
-                        played = self.default_policy(self.env)
-                    self.env.play(played)
+                    played = policy(copy(env), players_name=players_name)
+                    if played not in env.legal_plays():
+                        played = self.default_policy(env)
+                    env.play(played)
                 except Exception as e:
-                    print("lkjlkjkj")
                     _pretty_catch(e, f"Caught the following exception "
                                      f"while player '{cp.name}' played:")
-                    print("lkjlkjkj")
-                    self.env.play(self.default_policy(self.env))
+                    env.play(self.default_policy(env))
             # Normal Mode
             else:
                 # Roll
-                if self.env.rolled is None:
-                    rolled = rollicy(self.env, players_name=self.players_name)
-                    self.env.roll(rolled)
+                if env.rolled is None:
+                    rolled = rollicy(env, players_name=players_name)
+                    env.roll(rolled)
                 # Play
-                played = policy(self.env, players_name=self.players_name)
+                played = policy(env, players_name=players_name)
                 if played is None:
-                    played = self.default_policy(self.env)
-                self.env.play(played)
+                    played = self.default_policy(env)
+                env.play(played)
 
 
 def _width(str_: str):
@@ -159,8 +153,8 @@ def _pretty_catch(e: Exception, msg: str = 'Caught:') -> None:
         ╭──────────────────────────────────────────────────────────
         │ Traceback (most recent call last):
         │   File "/path/to/game.py", line 110, in run
-        │     played = policy(deepcopy(self.env),
-        │              ^^^^^^^^^^^^^^^^^^^^^^^^^^
+        │     played = policy(copy(self.env),
+        │              ^^^^^^^^^^^^^^^^^^^^^^
         │   File "/path/to/policy.py", line 33, in random_play
         │     return random.choice(None)  # IndexError on purpose
         │            ^^^^^^^^^^^^^^^^^^^
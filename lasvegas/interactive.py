@@ -8,17 +8,22 @@ Exported functions:
 
 __all__ = ['confront', 'play_vs']
 
-import itertools
+import random
 
 from numpy.typing import NDArray
 from tqdm import tqdm
 import numpy as np
-import tabulate
 
+from ._parallel import run_in_chunks
+from ._table import rounded_table
 from .act import BasePlayer, Human, Policy
 from .game import Game, _width
 
 
+# Number of games whose scores are buffered before being ranked at once
+_BATCH_GAMES = 1024
+
+
 def play_vs(
         num_players: int | None = None,
         /,
@@ -80,6 +85,7 @@ def confront(
         games: int = 100,
         show: bool = True,
         out: bool = False,
+        processes: int = 1,
         **gameargs) -> tuple | None:
     """ Confronts different policies in a multiple-games match.
 
@@ -102,6 +108,11 @@ def confront(
     ----------
         games (int): Number of games the match is played over.
         out (bool): Whether or not to return the results.
+        processes (int): Number of worker processes the games are
+            spread over. Policies must then be picklable (_e.g._
+            defined at module level). Chunk seeds are drawn from the
+            game's generator, so a `seed` in `gameargs` still replays
+            the same match. Defaults to `1`, _i.e._ no worker.
         show (bool): Whether or not to show the results in CLI.
         *policies (Policy | None): Policies to confront.
         **gameargs: Passed to `Game` after `num_players` processing.
@@ -120,24 +131,18 @@ def confront(
                           name=f"Policy {i}: {policy and policy.__name__}")
                for i, policy in enumerate(policies)]
     # Match:
-    # Loop over games
     game = Game(players, **gameargs)
-    rankings = np.zeros((P, game.env.num_collectors))
-    avg_scores = np.zeros((P, game.env.num_collectors, 2))
-    for _ in tqdm(range(games)):
-        game.run()
-        # Find winner
-        order = game.env.rank_order()
-        ordered_scores = game.env.scores[order]
-        ranks = np.arange(game.env.num_collectors)
-        for i, (s, ss) in enumerate(itertools.pairwise(ordered_scores)):
-            if np.all(s == ss):
-                ranks[i+1] = ranks[i]
-        for score, rank, i_pol in zip(ordered_scores, ranks, order):
-            if i_pol < P:
-                rankings[i_pol, rank] += 1
-                avg_scores[i_pol, rank] += score  # (tot, num)
-    avg_scores /= np.expand_dims(rankings, axis=-1)
+    if processes > 1 and games > 1:
+        parts = run_in_chunks(_run_games, game, games, processes)
+        rankings = sum(part[0] for part in parts)
+        avg_scores = sum(part[1] for part in parts)
+    else:
+        rankings, avg_scores = _run_games(game, games)
+    # Ranks never reached have no average (`nan`), silently
+    avg_scores = np.divide(avg_scores,
+                           np.expand_dims(rankings, axis=-1),
+                           out=np.full_like(avg_scores, np.nan),
+                           where=np.expand_dims(rankings > 0, axis=-1))
     result = rankings, avg_scores
     # Show (?)
     if show:
@@ -151,6 +156,71 @@ def confront(
         return result
 
 
+def _run_games(
+        game: Game,
+        games: int,
+        seed: int | None = None,
+        progress: bool = True) -> tuple[NDArray[float], NDArray[float]]:
+    """ Runs `games` games of a `confront` match.
+
+    Arguments:
+    ----------
+        game (Game): Game to run, with one player per policy.
+        games (int): Number of games to run.
+        seed (int | None): If not `None`, used to seed `random` and
+            the environment's generators first. Defaults to `None`.
+        progress (bool): Whether or not to show a progress bar.
+            Defaults to `True`.
+
+    Returns:
+    --------
+        rankings, sum_scores (tuple[NDArray[float], NDArray[float]]):
+            Respectively the number of times every player finished at
+            every rank, and the sum of its scores at this rank.
+    """
+    if seed is not None:
+        random.seed(seed)
+        game.env.seed(seed)
+    P = game.env.num_players
+    rankings = np.zeros((P, game.env.num_collectors))
+    sum_scores = np.zeros((P, game.env.num_collectors, 2))
+    # Final scores are only copied in the loop, and ranked by batches
+    batch = np.empty((min(games, _BATCH_GAMES), game.env.num_collectors, 2),
+                     dtype=int)
+    for g in tqdm(range(games), disable=not progress):
+        game.run()
+        batch[g % len(batch)] = game.env.scores
+        if g % len(batch) == len(batch) - 1 or g == games - 1:
+            _tally(batch[:g % len(batch) + 1], P, rankings, sum_scores)
+    return rankings, sum_scores
+
+
+def _tally(
+        scores: NDArray[int],
+        P: int,
+        rankings: NDArray[float],
+        sum_scores: NDArray[float]) -> None:
+    """ Adds a batch of final scores to `confront` results in place.
+
+    Arguments:
+    ----------
+        scores (NDArray[int]): Final `(tot, num)` scores of every
+            collector, for every game of the batch.
+        P (int): Number of players, the first collectors.
+        rankings, sum_scores (NDArray[float]): Updated as described in
+            `_run_games`.
+    """
+    tot, num = scores[..., 0], scores[..., 1]
+    # Rank is the number of strictly better collectors (equals share)
+    better = ((tot[:, None, :] > tot[:, :, None])
+              | ((tot[:, None, :] == tot[:, :, None])
+                 & (num[:, None, :] > num[:, :, None])))
+    ranks = better.sum(axis=-1)[:, :P]
+    policies = np.broadcast_to(np.arange(P), ranks.shape)
+    np.add.at(rankings, (policies, ranks), 1)
+    np.add.at(sum_scores, (policies, ranks), scores[:, :P])
+
+
 def _display_confront(
         game: Game,
         result: tuple[NDArray[int], NDArray[float]],
@@ -169,16 +239,14 @@ def _display_confront(
         line = [player.name]
         for rank_occ, (avg_tot, avg_num) in zip(ranks_occ, avg_scores):
             if np.isnan(avg_tot):
-                line += [rank_occ, "- (-)"]
+                line += [int(rank_occ), "- (-)"]
             else:
-                line += [rank_occ,
+                line += [int(rank_occ),
                          f'{round(avg_tot)} ({round(avg_num, ndigits=1)})']
         lines.append(line)
-    # Tabulate
-    PADDING_bak = tabulate.MIN_PADDING
-    tabulate.MIN_PADDING = 0
-    table = tabulate.tabulate(lines, headers, "rounded_outline")
-    tabulate.MIN_PADDING = PADDING_bak
+    # Table
+    colalign = ['left'] + ['right', 'left'] * game.env.num_collectors
+    table = rounded_table(lines, headers, colalign)
     # Print
     print(f"Match in {games} games"
           f"{' with ' + gameargs_str + ':' if gameargs_str else ':'}")
@@ -11,12 +11,14 @@ from math import ceil, log10
 from time import perf_counter
 from typing import Any, Sequence
 
+from numpy.typing import NDArray
 from tqdm import tqdm
 import numpy as np
-import tabulate
 
 from lasvegas.act import BasePlayer, Policy
 from lasvegas.core import RuleBook
+from lasvegas._parallel import run_in_chunks
+from lasvegas._table import rounded_table
 from lasvegas.game import Game
 
 
@@ -27,6 +29,8 @@ def main(policy: Policy | None = None,
          games: int = 100,
          out: bool = False,
          /,
+         *,
+         processes: int = 1,
          **gameargs: Any) -> list[TimeStat] | None:
     """ Runs multiple games and times execution before displaying stats.
 
@@ -37,6 +41,9 @@ def main(policy: Policy | None = None,
             If `None`, `Game` will use default -- uniformly random.
         out (bool): Default is `False`, meaning results are only
             displayed. If `True`, results are only returned.
+        processes (int): Number of processes to run the games with.
+            Parallel runs finish sooner, but concurrent games can be
+            slower, so use `1` for steadier timings. Defaults to `1`.
         **gameargs (Any): Ruleset to use for performance measure. If
             `num_players` is not specified, all values from
             `GameRules.rulebook_min_players` to
@@ -53,7 +60,11 @@ def main(policy: Policy | None = None,
         if "num_players" in gameargs
         else set(RuleBook.xtr_rules))
     results = [
-        run_gameset(policy, games, num_players=num_players, **gameargs)
+        run_gameset(policy,
+                    games,
+                    processes=processes,
+                    num_players=num_players,
+                    **gameargs)
         for num_players in all_num_players]
     if out:
         return results
@@ -67,6 +78,8 @@ def main(policy: Policy | None = None,
 def run_gameset(
         policy: Policy | None,
         games: int,
+        *,
+        processes: int = 1,
         **gameargs: Any) -> TimeStat:
     """ Perf measurement logic, given a oplicy and gameargs.
 
@@ -76,11 +89,19 @@ def run_gameset(
     START                                                   END
       |game-instanciation-----game-is-played-----game-is-over|
     ```
+    One untimed game is played before every batch of timed games (one
+    batch per worker chunk in parallel), so that one-time costs such
+    as lazy imports (_e.g._ `numpy.random`) or the filling of
+    memoization caches are not measured, even in spawned workers.
 
     Arguments:
     ----------
         games (int): Number of games to run and time.
         policy (Policy | None): Policy used for all players in the game.
+        processes (int): If more than `1`, games are split in chunks
+            timed by that many worker processes. Chunk seeds are
+            drawn from the game's generator, so games are replayed
+            given a `seed` in `gameargs`. Defaults to `1`.
         **gameargs (Any): Passed to `Game`.
 
     Returns:
@@ -94,24 +115,65 @@ def run_gameset(
         `AssertionError` if `not games > 0`.
     """
     assert games > 0
-    durations = np.zeros(games)
     num_players = gameargs["num_players"]
     players = [BasePlayer(play_func=policy) for _ in range(num_players)]
     game = Game(players, **gameargs)
+    if processes > 1:
+        parts = run_in_chunks(_time_games,
+                              game,
+                              games,
+                              processes,
+                              desc=f"{num_players} players",
+                              leave=False,
+                              disable=None)
+        durations = np.concatenate(parts)
+    else:
+        durations = _time_games(game, games)
+    mean = np.mean(durations)
+    stdv = np.std(durations)
+    min_ = np.min(durations)
+    max_ = np.max(durations)
+    return mean, stdv, min_, max_
+
+
+def _time_games(
+        game: Game,
+        games: int,
+        seed: int | None = None,
+        progress: bool = True) -> NDArray[float]:
+    """ Runs `games` games of `game` and times each of them.
+
+    One untimed game is played first, see `run_gameset`.
+
+    Arguments:
+    ----------
+        game (Game): Game to run.
+        games (int): Number of games to run and time.
+        seed (int | None): If not `None`, used to seed the environment's
+            generators first. Defaults to `None`.
+        progress (bool): Whether or not to show a progress bar, which
+            is never shown when not writing to a terminal. Defaults to
+            `True`.
+
+    Returns:
+    --------
+        durations (NDArray[float]): Elapsed time of every game, in `s`.
+    """
+    if seed is not None:
+        game.env.seed(seed)
+    game.run()  # Warm-up
+    durations = np.zeros(games)
     for i in tqdm(range(games),
-                  desc=f"{num_players} players",
-                  leave=False):
+                  desc=f"{game.env.num_players} players",
+                  leave=False,
+                  disable=None if progress else True):
         # Start
         start = perf_counter()
         game.run()
         # End
         end = perf_counter()
         durations[i] = end - start
-    mean = np.mean(durations)
-    stdv = np.std(durations)
-    min_ = np.min(durations)
-    max_ = np.max(durations)
-    return mean, stdv, min_, max_
+    return durations
 
 
 def display_results(
@@ -142,10 +204,7 @@ def display_results(
         [num_players] + list(map(format_time, result))
         for num_players, result in zip(all_num_players, results)]
     # Table
-    PADDING_bak = tabulate.MIN_PADDING
-    tabulate.MIN_PADDING = 0
-    table = tabulate.tabulate(lines, headers, "rounded_outline")
-    tabulate.MIN_PADDING = PADDING_bak
+    table = rounded_table(lines, headers, ['right'] + ['left'] * 4)
     # Print
     print(table)
 
@@ -0,0 +1,15 @@
+""" Tests for `lasvegas.interactive.confront`. """
+
+import numpy as np
+
+from lasvegas.act.policy import greedy_score, random_play
+from lasvegas.interactive import confront
+
+
+def test_seeded_parallel_confront_replays():
+    """ A seeded match spread over processes replays identically. """
+    kwargs = dict(games=20, show=False, out=True, processes=2, seed=3)
+    rankings, avg_scores = confront(random_play, greedy_score, **kwargs)
+    rankings_2, avg_scores_2 = confront(random_play, greedy_score, **kwargs)
+    np.testing.assert_array_equal(rankings, rankings_2)
+    np.testing.assert_array_equal(avg_scores, avg_scores_2)